@@ -7,27 +7,7 @@ from utils.logger import logger
 from utils.ai_assistant import AIAssistant
 from utils.email_fetcher import EmailFetcher
 from utils.email_sender import EmailSender
-
-
-def load_template(template_path: str = 'template/template.html') -> str:
-    """
-    加载HTML模板
-    
-    Args:
-        template_path: 模板文件路径
-    
-    Returns:
-        模板内容
-    """
-    try:
-        with open(template_path, 'r', encoding='utf-8') as file:
-            return file.read()
-    except FileNotFoundError:
-        logger.error(f"模板文件 {template_path} 不存在")
-        return "{weekly_summary}"  # 返回简单的占位符
-    except Exception as e:
-        logger.error(f"读取模板文件时出错: {str(e)}")
-        return "{weekly_summary}"
+from utils.template_registry import template_registry
 
 
 def generate_weekly_report():
@@ -73,8 +53,7 @@ def generate_weekly_report():
         print("=" * 50 + "\n")
 
         # 使用模板生成周报
-        html_template = load_template()
-        weekly_summary = html_template.format(weekly_summary=ai_content)
+        weekly_summary = template_registry.render(ai_content, config.imap_config["username"])
 
         # 询问是否保存到草稿箱
         save_to_drafts = input("是否保存周报到草稿箱？(y/n): ").strip().lower() == 'y'
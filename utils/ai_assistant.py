@@ -4,7 +4,7 @@ AI助手工具类
 import requests
 import email
 from datetime import datetime
-from typing import List, Tuple
+from typing import Iterable, Tuple
 from .logger import logger
 
 
@@ -27,12 +27,12 @@ class AIAssistant:
         if not self.api_key:
             raise ValueError("AI API密钥未设置，请检查环境变量")
 
-    def generate_weekly_summary(self, daily_reports: List[Tuple[str, str]]) -> str:
+    def generate_weekly_summary(self, daily_reports: Iterable[Tuple[str, str]]) -> str:
         """
         根据日报生成周报
         
         Args:
-            daily_reports: 日报列表，每项为(日期, 内容)元组
+            daily_reports: 日报列表或迭代器（如EmailFetcher.iter_reports()），每项为(日期, 内容)元组
         
         Returns:
             生成的周报内容
@@ -40,14 +40,13 @@ class AIAssistant:
         Raises:
             Exception: 当AI请求失败时
         """
-        if not daily_reports:
+        # 格式化日报内容，使其更易于AI处理，迭代器只遍历一次
+        formatted_reports = self._format_reports(daily_reports)
+        if not formatted_reports:
             logger.warning("没有找到日报内容，无法生成周报")
             return "本周没有找到日报内容，无法生成周报。"
 
         try:
-            # 格式化日报内容，使其更易于AI处理
-            formatted_reports = self._format_reports(daily_reports)
-
             headers = {
                 "Content-Type": "application/json",
                 "Authorization": f"Bearer {self.api_key}"
@@ -81,33 +80,41 @@ class AIAssistant:
             logger.error(f"生成周报时出错: {str(e)}")
             raise
 
-    def _format_reports(self, daily_reports: List[Tuple[str, str]]) -> str:
+    def _format_reports(self, daily_reports: Iterable[Tuple[str, str]]) -> str:
         """
         格式化日报内容，使其更易于AI处理
         
         Args:
-            daily_reports: 日报列表
+            daily_reports: 日报列表或迭代器
         
         Returns:
-            格式化后的日报内容
+            格式化后的日报内容，没有日报时返回空字符串
         """
+        # 逐条解析日期，只保留排序所需的日期和正文
+        entries = []
+        try:
+            for date, content in daily_reports:
+                try:
+                    parsed_date = email.utils.parsedate_to_datetime(date) if date else None
+                except Exception as e:
+                    logger.warning(f"解析日报日期 {date} 时出错: {str(e)}")
+                    parsed_date = None
+                entries.append((parsed_date, content))
+        except Exception as e:
+            logger.error(f"读取日报内容时出错: {str(e)}")
+
         try:
             # 按日期排序
+            now = datetime.now()
             sorted_reports = sorted(
-                daily_reports,
-                key=lambda x: email.utils.parsedate_to_datetime(x[0]) if x[0] else datetime.now()
+                entries,
+                key=lambda x: x[0] or now
             )
 
             formatted = []
-            for i, (date, content) in enumerate(sorted_reports):
+            for i, (parsed_date, content) in enumerate(sorted_reports):
                 try:
-                    # 解析日期
-                    if date:
-                        parsed_date = email.utils.parsedate_to_datetime(date)
-                        date_str = parsed_date.strftime("%Y-%m-%d %A")
-                    else:
-                        date_str = "未知日期"
-
+                    date_str = parsed_date.strftime("%Y-%m-%d %A") if parsed_date else "未知日期"
                     formatted.append(f"===== 日报 {i + 1}: {date_str} =====\n{content}\n")
                 except Exception as e:
                     logger.warning(f"格式化日报 {i + 1} 时出错: {str(e)}")
@@ -117,4 +124,4 @@ class AIAssistant:
         except Exception as e:
             logger.error(f"格式化日报内容时出错: {str(e)}")
             # 返回原始格式，确保程序不会崩溃
-            return str(daily_reports)
+            return "\n\n".join(content for _, content in entries)
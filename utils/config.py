@@ -32,7 +32,8 @@ class Config:
             "title_prefix": os.getenv("REPORT_TITLE_PREFIX"),
             "title_date_format": os.getenv("REPORT_TITLE_DATE_FORMAT"),
             "default_to": os.getenv("REPORT_DEFAULT_TO"),
-            "default_cc": os.getenv("REPORT_DEFAULT_CC")
+            "default_cc": os.getenv("REPORT_DEFAULT_CC"),
+            "template_dir": os.getenv("REPORT_TEMPLATE_DIR")
         }
 
     def validate_config(self) -> bool:
@@ -3,11 +3,15 @@
 """
 import imaplib
 import email
+import re
 from datetime import datetime, timedelta
 from email.header import decode_header
-from typing import List, Tuple
+from typing import Iterator, List, Optional, Tuple
 from .logger import logger
 
+# 每批获取邮件头的数量
+DEFAULT_BATCH_SIZE = 50
+
 
 def _decode_header(header: str) -> str:
     """
@@ -62,6 +66,27 @@ def _extract_email_body(msg) -> str:
         return ""
 
 
+def _iter_id_windows(id_data: bytes, batch_size: int) -> Iterator[List[bytes]]:
+    """
+    按固定大小分批遍历搜索结果中的邮件ID
+
+    Args:
+        id_data: IMAP搜索返回的邮件ID，以空格分隔
+        batch_size: 每批数量
+
+    Returns:
+        邮件ID批次迭代器
+    """
+    window = []
+    for match in re.finditer(rb'\d+', id_data):
+        window.append(match.group())
+        if len(window) >= batch_size:
+            yield window
+            window = []
+    if window:
+        yield window
+
+
 class EmailFetcher:
     """邮件获取类，负责从邮箱获取邮件内容"""
 
@@ -123,15 +148,20 @@ class EmailFetcher:
             logger.error(f"选择文件夹时出错: {str(e)}")
             return False
 
-    def fetch_weekly_reports(self, keyword: str = "日报") -> List[Tuple[str, str]]:
+    def iter_reports(self, keyword: str = "日报",
+                     batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Tuple[str, str]]:
         """
-        获取本周的日报邮件内容
-        
+        逐条获取本周的日报邮件内容
+
+        按批次获取邮件头筛选主题，只下载匹配邮件的完整内容，解析后立即释放原始数据，
+        内存占用与文件夹大小无关。
+
         Args:
             keyword: 邮件主题中的关键词
-        
+            batch_size: 每批获取邮件头的数量
+
         Returns:
-            邮件内容列表，每项为(日期, 内容)元组
+            邮件内容迭代器，每项为(日期, 内容)元组
         """
         try:
             # 计算本周一的日期
@@ -143,37 +173,105 @@ class EmailFetcher:
             status, messages = self.imap.search(None, f'SINCE "{since_date}"')
             if status != 'OK':
                 logger.warning(f"搜索邮件失败: {messages}")
+                return
+            id_data = messages[0] or b""
+            del messages
+            total = id_data.count(b' ') + 1 if id_data.strip() else 0
+            logger.info(f"找到 {total} 封邮件")
+
+            for window in _iter_id_windows(id_data, batch_size):
+                for mail_id in self._match_subject(window, keyword):
+                    report = self._fetch_report(mail_id)
+                    if report:
+                        yield report
+        except Exception as e:
+            logger.error(f"获取周报邮件时出错: {str(e)}")
+
+    def _match_subject(self, mail_ids: List[bytes], keyword: str) -> List[bytes]:
+        """
+        批量获取邮件头，筛选主题包含关键词的邮件
+
+        Args:
+            mail_ids: 邮件ID列表
+            keyword: 邮件主题中的关键词
+
+        Returns:
+            匹配的邮件ID列表
+        """
+        try:
+            status, msg_data = self.imap.fetch(b','.join(mail_ids),
+                                               '(BODY.PEEK[HEADER.FIELDS (SUBJECT)])')
+            if status != 'OK':
+                logger.warning(f"获取邮件头失败: {msg_data}")
                 return []
 
-            mail_ids = messages[0].split()
-            logger.info(f"找到 {len(mail_ids)} 封邮件")
-
-            results = []
-            for mail_id in mail_ids:
-                try:
-                    status, msg_data = self.imap.fetch(mail_id, '(RFC822)')
-                    if status != 'OK':
-                        logger.warning(f"获取邮件 {mail_id} 失败: {msg_data}")
-                        continue
-
-                    msg = email.message_from_bytes(msg_data[0][1])
-                    subject = _decode_header(msg["Subject"])
-
-                    if keyword in subject:
-                        date = msg.get("Date")
-                        body = _extract_email_body(msg)
-                        if body:
-                            results.append((date, body))
-                            logger.debug(f"处理邮件: {subject}, 日期: {date}")
-                except Exception as e:
-                    logger.error(f"处理邮件 {mail_id} 时出错: {str(e)}")
+            matched = []
+            for item in msg_data:
+                if not isinstance(item, tuple):
                     continue
-
-            return results
+                header = email.message_from_bytes(item[1])
+                if keyword in _decode_header(header["Subject"]):
+                    matched.append(item[0].split()[0])
+            return matched
         except Exception as e:
-            logger.error(f"获取周报邮件时出错: {str(e)}")
+            logger.error(f"获取邮件头时出错: {str(e)}")
             return []
 
+    def _fetch_report(self, mail_id: bytes) -> Optional[Tuple[str, str]]:
+        """
+        获取单封邮件并提取日期和正文
+
+        Args:
+            mail_id: 邮件ID
+
+        Returns:
+            (日期, 内容)元组，失败或正文为空时返回None
+        """
+        try:
+            status, msg_data = self.imap.fetch(mail_id, '(RFC822)')
+            if status != 'OK':
+                logger.warning(f"获取邮件 {mail_id} 失败: {msg_data}")
+                return None
+
+            msg = email.message_from_bytes(msg_data[0][1])
+            del msg_data
+            date = msg.get("Date")
+            body = _extract_email_body(msg)
+            if body:
+                logger.debug(f"处理邮件: {_decode_header(msg['Subject'])}, 日期: {date}")
+                return date, body
+            return None
+        except Exception as e:
+            logger.error(f"处理邮件 {mail_id} 时出错: {str(e)}")
+            return None
+
+    def fetch_weekly_reports(self, keyword: str = "日报") -> List[Tuple[str, str]]:
+        """
+        获取本周的日报邮件内容
+        
+        Args:
+            keyword: 邮件主题中的关键词
+        
+        Returns:
+            邮件内容列表，每项为(日期, 内容)元组
+        """
+        return list(self.iter_reports(keyword))
+
+    def iter_drafts(self, keyword: str = "日报",
+                    batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Tuple[str, str]]:
+        """
+        逐条获取草稿箱中的日报
+
+        Args:
+            keyword: 邮件主题中的关键词
+            batch_size: 每批获取邮件头的数量
+
+        Returns:
+            邮件内容迭代器
+        """
+        if self.select_folder(self.drafts):
+            yield from self.iter_reports(keyword, batch_size)
+
     def fetch_drafts(self, keyword: str = "日报") -> List[Tuple[str, str]]:
         """
         获取草稿箱中的日报
@@ -184,6 +282,4 @@ class EmailFetcher:
         Returns:
             邮件内容列表
         """
-        if self.select_folder(self.drafts):
-            return self.fetch_weekly_reports(keyword)
-        return []
+        return list(self.iter_drafts(keyword))
@@ -5,26 +5,28 @@ import imaplib
 from datetime import datetime, timezone
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from email.mime.image import MIMEImage
 from typing import Optional
 from .logger import logger
+from .template_registry import TemplateRegistry, template_registry
 
 
 class EmailSender:
     """邮件发送类，负责创建和发送邮件"""
 
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, registry: Optional[TemplateRegistry] = None):
         """
         初始化邮件发送器
         
         Args:
             config: IMAP配置字典
+            registry: 模板注册表，默认使用全局注册表
         """
         self.smtp_server = config["smtp_server"]
         self.username = config["username"]
         self.password = config["password"]
         self.drafts_folder = config["drafts"]
         self.imap_server = config["server"]
+        self.registry = registry or template_registry
 
         # 验证必要的配置
         if not all([self.smtp_server, self.username, self.password]):
@@ -54,16 +56,9 @@ class EmailSender:
 
         msg.attach(MIMEText(content, 'html'))
 
-        # 添加嵌入图片
-        try:
-            with open('template/mengxiang.PNG', 'rb') as f:
-                img = MIMEImage(f.read())
-                img.add_header('Content-ID', '<image1>')  # 这里的image1对应HTML中的cid:image1
-                msg.attach(img)
-        except FileNotFoundError:
-            logger.warning("未找到图片文件 template/mengxiang.PNG，跳过图片附件")
-        except Exception as e:
-            logger.error(f"添加图片附件时出错: {str(e)}")
+        # 添加嵌入图片，图片已由注册表预先编码，可直接复用
+        for img in self.registry.get_inline_images(self.username):
+            msg.attach(img)
 
         return msg
 
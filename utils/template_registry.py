@@ -0,0 +1,243 @@
+"""
+模板与邮件资源缓存模块
+"""
+import os
+from email.mime.image import MIMEImage
+from string import Formatter
+from typing import Dict, List, Optional, Tuple
+from .config import config
+from .logger import logger
+
+# 模板中允许使用的占位符
+ALLOWED_FIELDS = {"weekly_summary", "signature"}
+# 模板中必须包含的占位符
+REQUIRED_FIELDS = {"weekly_summary"}
+# 模板读取失败时使用的默认模板
+FALLBACK_TEMPLATE = "{weekly_summary}"
+# 默认内嵌图片，Content-ID -> 文件名
+DEFAULT_INLINE_IMAGES = {"image1": "mengxiang.PNG"}
+
+
+class CompiledTemplate:
+    """预编译模板，加载时解析一次，渲染时只做字符串拼接"""
+
+    def __init__(self, source: str):
+        """
+        解析并校验模板
+
+        Args:
+            source: 模板内容
+
+        Raises:
+            ValueError: 当模板格式错误或占位符不合法时
+        """
+        self.source = source
+        self._parts: List[Tuple[str, Optional[str]]] = []
+
+        fields = set()
+        for literal, field, format_spec, conversion in Formatter().parse(source):
+            if field is not None:
+                if format_spec or conversion:
+                    raise ValueError(f"模板占位符 {{{field}}} 不支持格式说明或转换")
+                if field not in ALLOWED_FIELDS:
+                    raise ValueError(f"模板包含未知占位符: {{{field}}}")
+                fields.add(field)
+            self._parts.append((literal, field))
+
+        missing = REQUIRED_FIELDS - fields
+        if missing:
+            raise ValueError(f"模板缺少占位符: {', '.join(sorted(missing))}")
+        self.fields = fields
+
+    def render(self, **values: str) -> str:
+        """
+        渲染模板
+
+        Args:
+            values: 占位符取值，未提供的占位符按空字符串处理
+
+        Returns:
+            渲染后的内容
+        """
+        chunks = []
+        for literal, field in self._parts:
+            chunks.append(literal)
+            if field is not None:
+                chunks.append(values.get(field) or "")
+        return "".join(chunks)
+
+
+class TemplateRegistry:
+    """
+    模板与内嵌图片注册表
+
+    模板和签名按文件修改时间缓存，文件变化后自动重新加载；内嵌图片预先编码为
+    MIMEImage，可在多封邮件间复用。若存在 accounts/<账号>/ 目录，则其中的
+    template.html、signature.html 和图片优先于模板根目录下的同名文件。
+    """
+
+    def __init__(self, template_dir: str = "template",
+                 inline_images: Optional[Dict[str, str]] = None):
+        """
+        初始化注册表
+
+        Args:
+            template_dir: 模板根目录
+            inline_images: 内嵌图片配置，Content-ID -> 文件名
+        """
+        self.template_dir = template_dir
+        self.inline_images = dict(DEFAULT_INLINE_IMAGES if inline_images is None else inline_images)
+        # 路径 -> (修改时间, 缓存内容)
+        self._templates: Dict[str, Tuple[Optional[float], CompiledTemplate]] = {}
+        self._signatures: Dict[str, Tuple[Optional[float], str]] = {}
+        self._images: Dict[Tuple[str, str], Tuple[Optional[float], Optional[MIMEImage]]] = {}
+
+    def _resolve(self, filename: str, account: Optional[str] = None) -> str:
+        """
+        查找文件路径，账号目录优先
+
+        Args:
+            filename: 文件名
+            account: 邮箱账号
+
+        Returns:
+            文件路径
+        """
+        if account:
+            account_path = os.path.join(self.template_dir, "accounts", account, filename)
+            if os.path.exists(account_path):
+                return account_path
+        return os.path.join(self.template_dir, filename)
+
+    @staticmethod
+    def _mtime(path: str) -> Optional[float]:
+        """获取文件修改时间，文件不存在时返回None"""
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+
+    def get_template(self, account: Optional[str] = None) -> CompiledTemplate:
+        """
+        获取预编译模板
+
+        Args:
+            account: 邮箱账号
+
+        Returns:
+            预编译模板，读取或校验失败时返回默认模板
+        """
+        path = self._resolve("template.html", account)
+        mtime = self._mtime(path)
+        cached = self._templates.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                template = CompiledTemplate(file.read())
+            logger.info(f"已加载模板 {path}")
+        except FileNotFoundError:
+            logger.error(f"模板文件 {path} 不存在")
+            template = CompiledTemplate(FALLBACK_TEMPLATE)
+        except Exception as e:
+            logger.error(f"读取模板文件 {path} 时出错: {str(e)}")
+            template = CompiledTemplate(FALLBACK_TEMPLATE)
+
+        self._templates[path] = (mtime, template)
+        return template
+
+    def get_signature(self, account: Optional[str] = None) -> str:
+        """
+        获取签名
+
+        Args:
+            account: 邮箱账号
+
+        Returns:
+            签名内容，文件不存在时返回空字符串
+        """
+        path = self._resolve("signature.html", account)
+        mtime = self._mtime(path)
+        cached = self._signatures.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        signature = ""
+        if mtime is not None:
+            try:
+                with open(path, 'r', encoding='utf-8') as file:
+                    signature = file.read()
+            except Exception as e:
+                logger.error(f"读取签名文件 {path} 时出错: {str(e)}")
+
+        self._signatures[path] = (mtime, signature)
+        return signature
+
+    def render(self, weekly_summary: str, account: Optional[str] = None) -> str:
+        """
+        使用模板生成邮件正文
+
+        Args:
+            weekly_summary: 周报内容
+            account: 邮箱账号
+
+        Returns:
+            邮件正文
+        """
+        template = self.get_template(account)
+        signature = self.get_signature(account) if "signature" in template.fields else ""
+        return template.render(weekly_summary=weekly_summary, signature=signature)
+
+    def get_inline_images(self, account: Optional[str] = None) -> List[MIMEImage]:
+        """
+        获取预编码的内嵌图片
+
+        返回的MIME对象会被多封邮件共享，调用方不应修改。
+
+        Args:
+            account: 邮箱账号
+
+        Returns:
+            内嵌图片列表
+        """
+        images = []
+        for content_id, filename in self.inline_images.items():
+            path = self._resolve(filename, account)
+            mtime = self._mtime(path)
+            cached = self._images.get((content_id, path))
+            if not cached or cached[0] != mtime:
+                cached = (mtime, self._encode_image(path, content_id, mtime))
+                self._images[(content_id, path)] = cached
+            if cached[1] is not None:
+                images.append(cached[1])
+        return images
+
+    @staticmethod
+    def _encode_image(path: str, content_id: str, mtime: Optional[float]) -> Optional[MIMEImage]:
+        """
+        读取图片并编码为MIME对象
+
+        Args:
+            path: 图片路径
+            content_id: 对应HTML中cid:的标识
+            mtime: 文件修改时间
+
+        Returns:
+            MIME图片对象，读取失败时返回None
+        """
+        if mtime is None:
+            logger.warning(f"未找到图片文件 {path}，跳过图片附件")
+            return None
+        try:
+            with open(path, 'rb') as f:
+                img = MIMEImage(f.read())
+            img.add_header('Content-ID', f'<{content_id}>')
+            return img
+        except Exception as e:
+            logger.error(f"添加图片附件时出错: {str(e)}")
+            return None
+
+
+# 全局模板注册表
+template_registry = TemplateRegistry(config.report_config["template_dir"] or "template")